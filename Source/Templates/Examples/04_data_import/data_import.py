@@ -1,75 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 
+# Decode JSON with orjson when it is installed, as it is faster than the standard library json module
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 # Dublin Bikes GBFS API endpoints
 GBFS_STATION_INFO_URL = "https://api.cyclocity.fr/contracts/dublin/gbfs/v2/station_information.json"
 GBFS_STATION_STATUS_URL = "https://api.cyclocity.fr/contracts/dublin/gbfs/v2/station_status.json"
 OUTPUT_XLSX = "04_data_import/dublinbikes.xlsx"
 
+# Retry a failed download up to 3 times, waiting a little longer each time.
+# Only GET requests are retried, as they are safe to repeat.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
+
+def download_json(session, url):
+    """Download a JSON document, raising an error for a failed request."""
+    response = session.get(url, timeout=15)
+    response.raise_for_status()
+    return json_loads(response.content)
+
 def main():
 
-    # Download station information (names, locations)
-    info_response = requests.get(GBFS_STATION_INFO_URL, timeout=15)
-    info_response.raise_for_status()
-    
-    # Build a dictionary of stations by their ID
-    station_info = {}
-    for station in info_response.json()["data"]["stations"]:
-        station_id = station["station_id"]
-        station_info[station_id] = station
-
-    # Download station status (real-time availability)
-    status_response = requests.get(GBFS_STATION_STATUS_URL, timeout=15)
-    status_response.raise_for_status()
-    
-    # Build a dictionary of station status by ID
-    station_status = {}
-    for station in status_response.json()["data"]["stations"]:
-        station_id = station["station_id"]
-        station_status[station_id] = station
-
-    # Create workbook & sheet
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Bikes"
-
-    # Write the header row
-    headers = ["Station Name", "Available Bikes", "Empty Slots"]
-    ws.append(headers)
+    # Download station information (names, locations) and station status (real-time availability)
+    # at the same time, sharing one session so connections to the API host are reused
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=2) as executor:
+        session.mount("https://", HTTPAdapter(max_retries=RETRY_POLICY))
+        info_future = executor.submit(download_json, session, GBFS_STATION_INFO_URL)
+        status_future = executor.submit(download_json, session, GBFS_STATION_STATUS_URL)
+        info_data = info_future.result()
+        status_data = status_future.result()
 
-    # Adjust column widths for readability
+    # Build dictionaries of station information and station status by their ID
+    station_info = {station["station_id"]: station for station in info_data["data"]["stations"]}
+    station_status = {station["station_id"]: station for station in status_data["data"]["stations"]}
+
+    # Create a write-only workbook, which streams rows to the file instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Bikes")
+
+    # Adjust column widths for readability (must be set before any rows are written)
     ws.column_dimensions["A"].width = 40
     ws.column_dimensions["B"].width = 18
     ws.column_dimensions["C"].width = 15
 
-    # Apply header style (bold, shaded, centered)
+    # Write the header row, styled bold, shaded and centered
+    headers = ["Station Name", "Available Bikes", "Empty Slots"]
     header_font = Font(bold=True)
     header_fill = PatternFill("solid", fgColor="DDDDDD")
     header_align = Alignment(horizontal="center", vertical="center")
-    for cell in ws[1]:
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = header_font
         cell.fill = header_fill
         cell.alignment = header_align
+        header_cells.append(cell)
+    ws.append(header_cells)
 
     # Combine station info and status
-    stations = []
-    for station_id, info in station_info.items():
-        if station_id in station_status:
-            status = station_status[station_id]
-            stations.append({
-                "name": info.get("name", ""),
-                "bikes": status.get("num_bikes_available", 0),
-                "docks": status.get("num_docks_available", 0)
-            })
-    
+    stations = [
+        {
+            "name": info.get("name", ""),
+            "bikes": station_status[station_id].get("num_bikes_available", 0),
+            "docks": station_status[station_id].get("num_docks_available", 0)
+        }
+        for station_id, info in station_info.items()
+        if station_id in station_status
+    ]
+
     # Sort stations alphabetically by name (case-insensitive)
     stations.sort(key=lambda s: s["name"].lower())
 
     # Write a row for each station
     for s in stations:
-        ws.append([s["name"], s["bikes"], s["docks"]])
+        ws.append((s["name"], s["bikes"], s["docks"]))
 
     # Save the Excel file
     wb.save(OUTPUT_XLSX)
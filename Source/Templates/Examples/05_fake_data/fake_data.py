@@ -1,6 +1,7 @@
 import sys
 from faker import Faker
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from pathlib import Path
 
@@ -21,39 +22,40 @@ else:
 # Write the Excel file to the same directory as this script
 outfile = Path(__file__).parent / FILENAME
 
-# Create workbook and worksheet
-wb = Workbook()
-ws = wb.active
-ws.title = "People"
+# Create a write-only workbook, which streams rows to the file instead of keeping every cell in memory
+wb = Workbook(write_only=True)
+ws = wb.create_sheet("People")
 
-# Add header row
-headers = ["Full Name", "Email", "Phone", "Address"]
-ws.append(headers)
-
-# Adjust column widths
+# Adjust column widths (must be set before any rows are written)
 ws.column_dimensions["A"].width = 28
 ws.column_dimensions["B"].width = 28
 ws.column_dimensions["C"].width = 18
 ws.column_dimensions["D"].width = 36
 
-# Apply header style
+# Add header row with header style
+headers = ["Full Name", "Email", "Phone", "Address"]
 hdr_font = Font(bold=True)
 hdr_fill = PatternFill("solid", fgColor="DDDDDD")
 hdr_align = Alignment(horizontal="center")
 
-for cell in ws[1]:
+hdr_cells = []
+for header in headers:
+    cell = WriteOnlyCell(ws, value=header)
     cell.font = hdr_font
     cell.fill = hdr_fill
     cell.alignment = hdr_align
+    hdr_cells.append(cell)
+ws.append(hdr_cells)
 
 # Generate fake data rows
+# Look up the Faker provider methods once, rather than on every row
 fake = Faker()
+fake_name = fake.name
+fake_email = fake.email
+fake_phone = fake.phone_number
+fake_addr = fake.street_address
 for _ in range(COUNT):
-    name = fake.name()
-    email = fake.email()
-    phone = fake.phone_number()
-    addr = fake.street_address()
-    ws.append([name, email, phone, addr])
+    ws.append((fake_name(), fake_email(), fake_phone(), fake_addr()))
 
 # Save the file
 wb.save(outfile)
@@ -8,6 +8,7 @@ What this script does:
 5) Writes a clean, formatted Excel file (fixed column widths, mm columns formatted).
 """
 
+import re
 import sys
 import pandas as pd
 
@@ -20,6 +21,11 @@ HEADER_ROW_EXCEL = 3       # header line is in row 3 in messy_data.xlsx (1-based
 COLUMNS = "A:C"            # we only read A..C from the input sheet
 SHEET_NAME_OUT = "Rainfall"
 
+# Cleaning patterns, compiled once when the script loads
+NON_NUMERIC_TEXT = re.compile(r"[,\sA-Za-z]+")                # commas/spaces/letters/units
+BLANK_VALUES = {"": pd.NA, "nan": pd.NA}                      # blank or 'nan' -> NaN
+YEAR_RANGE = re.compile(r"^(?P<start>[^-]*)-(?P<end>.*)$", re.DOTALL)    # "2001-2019" -> 2001, 2019
+
 
 class ValidationError(Exception):
     """Raised when invalid numeric data is found."""
@@ -39,42 +45,48 @@ def print_ok(msg: str) -> None:
 def clean_text_numbers_to_mm(series: pd.Series) -> pd.Series:
     """Convert text like '3.1mm', '1,234', '7.5 MM', or '  10  ' to numbers."""
     s = series.astype(str)
-    s = s.str.replace(r"[,\s]+", "", regex=True)      # remove commas/spaces
-    s = s.str.replace(r"[A-Za-z]+", "", regex=True)   # remove letters/units
-    s = s.replace({"": pd.NA, "nan": pd.NA})          # blank or 'nan' -> NaN
+    s = s.str.replace(NON_NUMERIC_TEXT, "", regex=True)
+    s = s.replace(BLANK_VALUES)
     return pd.to_numeric(s, errors="coerce")
 
 
 def validate_numeric_column(raw: pd.Series, parsed: pd.Series, excel_col: str) -> None:
     """Validate a column of numeric data."""
-    first_data_row_excel = HEADER_ROW_EXCEL + 1
+    # Check every row at once, then report the first row that fails
+    blank_mask = raw.isna() | raw.astype(str).str.strip().eq("")
+    invalid_mask = parsed.isna()
+    negative_mask = parsed.lt(0)
+
+    failed_mask = blank_mask | invalid_mask | negative_mask
+    if not failed_mask.any():
+        return
 
-    for idx in range(len(raw)):
-        raw_val = raw.iloc[idx]
-        num_val = parsed.iloc[idx]
-        excel_row = first_data_row_excel + idx
+    idx = int(failed_mask.to_numpy().argmax())
+    raw_val = raw.iloc[idx]
+    num_val = parsed.iloc[idx]
+    excel_row = HEADER_ROW_EXCEL + 1 + idx
 
-        if pd.isna(raw_val) or str(raw_val).strip() == "":
-            raise ValidationError(f"Invalid number at {excel_col}{excel_row}: blank or empty")
+    if blank_mask.iloc[idx]:
+        raise ValidationError(f"Invalid number at {excel_col}{excel_row}: blank or empty")
 
-        if pd.isna(num_val):
-            raise ValidationError(f"Invalid number at {excel_col}{excel_row}: '{raw_val}'")
+    if invalid_mask.iloc[idx]:
+        raise ValidationError(f"Invalid number at {excel_col}{excel_row}: '{raw_val}'")
 
-        if num_val < 0:
-            raise ValidationError(f"Negative value at {excel_col}{excel_row}: {num_val}")
+    raise ValidationError(f"Negative value at {excel_col}{excel_row}: {num_val}")
 
 
-def apply_formatting(ws, df: pd.DataFrame) -> None:
+def apply_formatting(ws) -> None:
     """Apply cell formatting for output sheet."""
     fixed_width = 18
-    mm_cols = {4, 5}  # 1-based column indices: D=4, E=5
+    max_row = ws.max_row
 
-    for col_idx in range(1, len(df.columns) + 1):
-        if col_idx in mm_cols:
-            for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=col_idx, max_col=col_idx):
-                row[0].number_format = "0.000"
+    # Format the mm columns (D and E) in one pass over their data cells
+    for column in ws.iter_cols(min_row=2, max_row=max_row, min_col=4, max_col=5):
+        for cell in column:
+            cell.number_format = "0.000"
 
-        letter = ws.cell(row=1, column=col_idx).column_letter
+    # The output always has five columns: Month, Start Year, End Year and the two mm columns
+    for letter in "ABCDE":
         ws.column_dimensions[letter].width = fixed_width
 
 
@@ -96,22 +108,12 @@ def process_excel(input_path: str, output_path: str) -> None:
     month_period = df["Month, period"].astype(str)
     parts = month_period.str.split(",", n=1, expand=True)
     month = parts[0].str.strip().str.title()
-    period = parts[1].str.strip() if parts.shape[1] > 1 else ""
-
-    # Simple dash-based year splitting (e.g. "2001-2019")
-    start_year = []
-    end_year = []
-    for text in period:
-        if isinstance(text, str) and "-" in text:
-            left, right = text.split("-", 1)
-            start_year.append(pd.to_numeric(left.strip(), errors="coerce"))
-            end_year.append(pd.to_numeric(right.strip(), errors="coerce"))
-        else:
-            start_year.append(pd.NA)
-            end_year.append(pd.NA)
-
-    start_year = pd.Series(start_year)
-    end_year   = pd.Series(end_year)
+    period = parts[1] if parts.shape[1] > 1 else pd.Series("", index=df.index)
+
+    # Simple dash-based year splitting (e.g. "2001-2019"), done for every row in one pass
+    years = period.str.extract(YEAR_RANGE)
+    start_year = pd.to_numeric(years["start"].str.strip(), errors="coerce")
+    end_year   = pd.to_numeric(years["end"].str.strip(), errors="coerce")
 
     colB_name, colC_name = df.columns[1], df.columns[2]
     colB_raw, colC_raw = df[colB_name], df[colC_name]
@@ -136,7 +138,7 @@ def process_excel(input_path: str, output_path: str) -> None:
     with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
         out.to_excel(writer, index=False, sheet_name=SHEET_NAME_OUT)
         ws = writer.sheets[SHEET_NAME_OUT]
-        apply_formatting(ws, out)
+        apply_formatting(ws)
 
 
 def process_data() -> None:
@@ -3,19 +3,39 @@
 
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+def clean_build_folders(pkg_dir):
+    """Remove the dist and build folders left behind by a package build."""
+    shutil.rmtree(pkg_dir / "dist", ignore_errors=True)
+    shutil.rmtree(pkg_dir / "build", ignore_errors=True)
+
+
 def build_wheel(pkg_dir):
     """Build a wheel for the given package."""
     dist = pkg_dir / "dist"
-    shutil.rmtree(dist, ignore_errors=True)
-    shutil.rmtree(pkg_dir / "build", ignore_errors=True)
-    
-    subprocess.run(
-        ["python", "-m", "pip", "wheel", "--no-deps", str(pkg_dir), "-w", str(dist)],
-        check=True,
+
+    # Build isolation is kept because the system Python on PATH is not guaranteed to have setuptools installed.
+    # pip's progress output is discarded, and its error output is only shown when the build fails.
+    result = subprocess.run(
+        [
+            "python", "-m", "pip", "wheel",
+            "--no-deps",
+            "--disable-pip-version-check",
+            str(pkg_dir),
+            "-w", str(dist),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
     )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise subprocess.CalledProcessError(result.returncode, result.args)
+
     return list(dist.glob("*.whl"))[0]
 
 
@@ -23,24 +43,29 @@ def main():
     root = Path(__file__).parent
     packages = [root / "packages/celbridge"]
     assets = root / "Assets/Python"
-    
+
     print("Building wheels...")
-    wheels = [build_wheel(pkg) for pkg in packages]
-    
+    for pkg in packages:
+        clean_build_folders(pkg)
+
+    # Each build spends its time waiting on a pip subprocess, so threads are enough to run them side by side
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        wheels = list(executor.map(build_wheel, packages))
+
     print(f"\nCopying to {assets.name}/...")
     assets.mkdir(parents=True, exist_ok=True)
     for old in assets.glob("*.whl"):
         old.unlink()
-    
+
+    # Wheel metadata does not need preserving, and copyfile uses the platform's fast copy path
     for whl in wheels:
-        shutil.copy2(whl, assets)
+        shutil.copyfile(whl, assets / whl.name)
         print(f"  {whl.name}")
 
     # Clean up build artifacts
     for pkg in packages:
-        shutil.rmtree(pkg / "dist", ignore_errors=True)
-        shutil.rmtree(pkg / "build", ignore_errors=True)
-    
+        clean_build_folders(pkg)
+
     print("\nDone!")
 
 
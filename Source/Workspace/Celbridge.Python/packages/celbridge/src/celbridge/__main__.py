@@ -14,8 +14,6 @@ import os
 import sys
 from typing import NamedTuple
 
-from celbridge.rpc_client import RpcClient
-from celbridge.cel_proxy import CelProxy
 from celbridge.repl_setup import setup_repl, POST_STARTUP_LINE
 
 # Set on the re-exec'd process so the inner python -m celbridge never re-bootstraps, then cleared
@@ -201,6 +199,18 @@ def _bootstrap(resolved: ResolvedLaunch):
     raise SystemExit(process.wait())
 
 
+def _preload_ipython():
+    """Import IPython so the REPL can start as soon as the connection and tool discovery finish.
+
+    Any import failure is left for the main thread's own import of IPython to report.
+    """
+    try:
+        import IPython  # noqa: F401
+        import traitlets.config  # noqa: F401
+    except Exception:
+        pass
+
+
 def main():
     """Connect to the Celbridge application and launch an interactive REPL."""
 
@@ -213,6 +223,17 @@ def main():
             _bootstrap(resolved)
         ipython_forward_arguments = resolved.ipython_arguments
 
+    # Imported only once no re-exec is pending: a bootstrapping launch replaces this process without
+    # ever connecting, so it should not pay for importing the proxy and its dependencies.
+    from celbridge.rpc_client import RpcClient
+    from celbridge.cel_proxy import CelProxy
+
+    # Importing IPython takes several hundred milliseconds. Overlap it with the connection, handshake and
+    # tool discovery below, which spend most of their time waiting on the host.
+    import threading
+    preload_thread = threading.Thread(target=_preload_ipython, name='celbridge-preload-ipython', daemon=True)
+    preload_thread.start()
+
     port = _resolve_rpc_port()
 
     mcp_tools_enabled = os.environ.get('CELBRIDGE_MCP_TOOLS') == '1'
@@ -268,6 +289,9 @@ def main():
     # Launch IPython with the cel proxy injected into the user namespace.
     # exec_lines runs after IPython is fully initialized, so customizations
     # that need get_ipython() (prompts, exit hooks, caching) work correctly.
+    # Wait for the preload first: importing the same package tree from two threads at once can trip
+    # CPython's module lock deadlock detection and raise _DeadlockError here in the main thread.
+    preload_thread.join()
     from traitlets.config import Config
     ipython_config = Config()
     ipython_config.InteractiveShellApp.exec_lines = _build_exec_lines(
@@ -53,7 +53,7 @@ class CelProxy:
     def __init__(self, client: RpcClient):
         self._client = client
         self._tools: list[dict] = []
-        self._aliases: list[str] = []
+        self._top_level_names: list[str] = []
         self._discover_tools()
 
     def __repr__(self) -> str:
@@ -69,6 +69,7 @@ class CelProxy:
             self._tools = []
             return
 
+        top_level_names = set()
         for tool in self._tools:
             tool_name = tool.get("name", "")
             alias = tool.get("alias", "")
@@ -81,17 +82,23 @@ class CelProxy:
             proxy.__doc__ = build_docstring(tool)
 
             self._register_proxy(alias, proxy)
-            self._aliases.append(alias)
+            top_level_names.add(alias.split(".", 1)[0])
+
+        # Computed once here because __getattr__ runs on every failed lookup, including the
+        # attribute probes IPython makes while completing and displaying values.
+        self._top_level_names = sorted(top_level_names)
 
         logger.info("Discovered %d broker tools", len(self._tools))
 
+        _, namespaced_tools = partition_tools_by_namespace(self._tools)
+
         self._register_builtin_commands()
-        self._build_namespace_docs()
+        self._build_namespace_docs(namespaced_tools)
         # Pydoc renders `help(instance)` via `type(instance).__doc__`, ignoring any
         # docstring assigned to the instance itself. CelProxy is effectively a singleton
         # in the REPL, so mutating the class docstring is safe and is the only way to
         # make the dynamic command list visible to `help(cel)`.
-        type(self).__doc__ = self._build_help_doc()
+        type(self).__doc__ = self._build_help_doc(namespaced_tools)
 
     def _register_builtin_commands(self) -> None:
         """Register built-in commands that are implemented in Python, not via MCP."""
@@ -137,7 +144,7 @@ class CelProxy:
         "webview": "Devtools-style automation of HTML and contribution editors",
     }
 
-    def _build_help_doc(self) -> str:
+    def _build_help_doc(self, namespaced_tools: dict[str, list[dict]]) -> str:
         """Build a compact docstring for help(cel) listing namespaces only."""
         lines = [
             "Provides Python access to the Celbridge application via RPC.",
@@ -146,8 +153,6 @@ class CelProxy:
             "",
         ]
 
-        _, namespaced_tools = partition_tools_by_namespace(self._tools)
-
         for namespace_name in sorted(namespaced_tools.keys()):
             method_count = len(namespaced_tools[namespace_name])
             description = self._namespace_descriptions.get(namespace_name, "")
@@ -163,7 +168,7 @@ class CelProxy:
 
         return "\n".join(lines)
 
-    def _build_namespace_docs(self) -> None:
+    def _build_namespace_docs(self, mcp_namespaced_tools: dict[str, list[dict]]) -> None:
         """Build __doc__ for each ToolNamespace from its registered methods.
 
         Each namespace gets its own dynamically created ToolNamespace subclass so
@@ -174,8 +179,6 @@ class CelProxy:
         and Python-only namespaces such as cel.agent (docs introspected from the
         callables registered on them).
         """
-        _, mcp_namespaced_tools = partition_tools_by_namespace(self._tools)
-
         for namespace_name in self._get_namespace_names():
             namespace = getattr(self, namespace_name, None)
             if namespace is None:
@@ -220,11 +223,12 @@ class CelProxy:
 
     def __getattr__(self, name: str):
         """Provide a helpful error when an unknown method is accessed."""
-        top_level_names = sorted(set(
-            alias.split(".", 1)[0] for alias in self._aliases
-        ))
+        # Private and dunder names are protocol probes (IPython's _repr_html_, copy's
+        # __deepcopy__, etc.), not mistyped commands, so they fail without a suggestion.
+        if name.startswith("_"):
+            raise AttributeError(name)
 
-        matches = difflib.get_close_matches(name, top_level_names, n=3, cutoff=0.5)
+        matches = difflib.get_close_matches(name, self._top_level_names, n=3, cutoff=0.5)
 
         if matches:
             suggestion = ", ".join(f"cel.{m}" for m in matches)
@@ -256,10 +260,8 @@ class CelProxy:
                     f"{len(args)} positional arguments"
                 )
 
-            arguments = {}
-            for index, value in enumerate(args):
-                camel_name = parameter_names[index]
-                arguments[camel_name] = value
+            # Positional arguments map onto parameter names in declaration order
+            arguments = dict(zip(parameter_names, args))
 
             for key, value in kwargs.items():
                 arguments[snake_to_camel(key)] = value
@@ -93,6 +93,11 @@ def apply_post_startup_customizations() -> None:
     _setup_prompts(ip)
 
 
+# Cursor home, erase the screen, then erase the scrollback (the order `clear` uses), so
+# bootstrap output printed before the banner does not stay in the terminal history.
+CLEAR_SCREEN_AND_SCROLLBACK = "\033[H\033[2J\033[3J"
+
+
 # Line executed inside IPython after startup to apply customizations that
 # require a running IPython instance (custom prompts, caching).
 POST_STARTUP_LINE = "from celbridge.repl_setup import apply_post_startup_customizations; apply_post_startup_customizations()"
@@ -112,13 +117,15 @@ def setup_repl(mcp_tools_enabled: bool = True) -> None:
         # Show a helpful message when the user exits the REPL
         atexit.register(lambda: print("\nCelbridge session ended. Type 'celbridge-py' to start a new session."))
 
-        # Clear the console and display Celbridge startup banner
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Clear the console without spawning a cls/clear process, then display Celbridge
+        # startup banner in a single write
         celbridge_version = os.environ.get('CELBRIDGE_VERSION', 'Unknown')
         python_version = platform.python_version()
-        print(f"Celbridge v{celbridge_version} - Python v{python_version}")
+        banner = f"{CLEAR_SCREEN_AND_SCROLLBACK}Celbridge v{celbridge_version} - Python v{python_version}\n"
         if mcp_tools_enabled:
-            print("Type help(cel) for a list of available commands.")
+            banner += "Type help(cel) for a list of available commands.\n"
+        sys.stdout.write(banner)
+        sys.stdout.flush()
 
     except Exception:
         print("Error during Celbridge startup:\n", file=sys.stderr)
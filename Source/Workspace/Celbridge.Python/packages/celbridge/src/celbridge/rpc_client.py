@@ -1,6 +1,7 @@
 """Minimal JSON-RPC 2.0 client over TCP using only the Python standard library."""
 
 import json
+import re
 import socket
 import logging
 
@@ -16,6 +17,17 @@ class RpcError(Exception):
 # headers are separated from the message body by a blank line (\r\n\r\n).
 HEADER_DELIMITER = b"\r\n\r\n"
 
+# Fixed start of the only header the client sends, kept as bytes so framing a request
+# only has to format the length.
+CONTENT_LENGTH_PREFIX = b"Content-Length: "
+
+# Requests sent to the application are small, but responses such as tools/list can run
+# to tens of kilobytes, so reads are sized to take a typical response in one or two calls.
+RECEIVE_CHUNK_SIZE = 65536
+
+# Matches the Content-Length header line directly in the raw header bytes
+CONTENT_LENGTH_PATTERN = re.compile(rb"^Content-Length:[ \t]*(\d+)", re.MULTILINE | re.IGNORECASE)
+
 
 class RpcClient:
     """JSON-RPC 2.0 client that communicates with the Celbridge application over TCP.
@@ -28,7 +40,9 @@ class RpcClient:
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._socket.connect((host, port))
         self._request_id = 0
-        self._receive_buffer = b""
+        # Held across calls so data read past the end of one message is kept for the next.
+        # Appending and deleting consumed bytes happen in place rather than rebuilding it.
+        self._receive_buffer = bytearray()
         logger.info(f"Connected to RPC server at {host}:{port}")
 
     def call(self, method: str, **params):
@@ -87,51 +101,48 @@ class RpcClient:
     def _send(self, message: str) -> None:
         """Send a Content-Length framed message."""
         message_bytes = message.encode('utf-8')
-        content_length = len(message_bytes)
-        header = f"Content-Length: {content_length}".encode('utf-8') + HEADER_DELIMITER
-        self._socket.sendall(header + message_bytes)
+        content_length = str(len(message_bytes)).encode('ascii')
+        self._socket.sendall(CONTENT_LENGTH_PREFIX + content_length + HEADER_DELIMITER + message_bytes)
 
-    def _receive(self) -> str:
+    def _receive(self) -> bytearray:
         """Receive a Content-Length framed message.
 
         Returns:
-            The message body as a string.
+            The raw UTF-8 message body. json.loads accepts bytes directly, so the body
+            is not decoded to a string first.
 
         Raises:
             RpcError: If the connection is closed or the message is malformed.
         """
-        # Read headers until we find \r\n\r\n
-        while HEADER_DELIMITER not in self._receive_buffer:
-            chunk = self._socket.recv(4096)
+        # Read headers until we find \r\n\r\n. Each scan resumes where the previous one
+        # stopped, backing up far enough to catch a delimiter split across two chunks.
+        delimiter_index = self._receive_buffer.find(HEADER_DELIMITER)
+        while delimiter_index == -1:
+            search_start = max(0, len(self._receive_buffer) - len(HEADER_DELIMITER) + 1)
+            chunk = self._socket.recv(RECEIVE_CHUNK_SIZE)
             if not chunk:
                 raise RpcError("Connection closed while reading response header")
             self._receive_buffer += chunk
+            delimiter_index = self._receive_buffer.find(HEADER_DELIMITER, search_start)
 
-        # Split headers from any remaining body data
-        header_end = self._receive_buffer.index(HEADER_DELIMITER) + 4
-        headers_bytes = self._receive_buffer[:header_end]
-        self._receive_buffer = self._receive_buffer[header_end:]
-
-        # Parse Content-Length header
-        headers_str = headers_bytes.decode('utf-8')
-        content_length = None
-        for line in headers_str.split('\r\n'):
-            if line.startswith('Content-Length:'):
-                content_length = int(line.split(':', 1)[1].strip())
-                break
-
-        if content_length is None:
+        # Parse Content-Length from the header block before dropping the headers from the
+        # buffer, since the match reads its group from the buffer's current contents.
+        header_end = delimiter_index + len(HEADER_DELIMITER)
+        content_length_match = CONTENT_LENGTH_PATTERN.search(self._receive_buffer, 0, header_end)
+        if content_length_match is None:
             raise RpcError("No Content-Length header in response")
+        content_length = int(content_length_match.group(1))
+        del self._receive_buffer[:header_end]
 
         # Read more data if we don't have the full body yet
         while len(self._receive_buffer) < content_length:
-            chunk = self._socket.recv(4096)
+            chunk = self._socket.recv(RECEIVE_CHUNK_SIZE)
             if not chunk:
                 raise RpcError("Connection closed while reading response body")
             self._receive_buffer += chunk
 
         # Extract the message body and leave any remainder in the buffer
         message_bytes = self._receive_buffer[:content_length]
-        self._receive_buffer = self._receive_buffer[content_length:]
+        del self._receive_buffer[:content_length]
 
-        return message_bytes.decode('utf-8')
+        return message_bytes
@@ -501,6 +501,22 @@ def test_unknown_attribute_shows_help_hint():
         assert "help(cel)" in str(exception)
 
 
+def test_private_attribute_raises_plain_attribute_error():
+    """Test that underscore names used by display and copy protocols are not treated as commands."""
+    tools = [
+        {"name": "app/version", "alias": "version", "description": "Version", "parameters": []},
+    ]
+    mock_client = _make_mock_client(tools)
+    cel = CelProxy(mock_client)
+
+    assert not hasattr(cel, "_repr_html_")
+    try:
+        cel.__deepcopy__
+        assert False, "Expected AttributeError"
+    except AttributeError as exception:
+        assert str(exception) == "__deepcopy__"
+
+
 def test_too_many_positional_args_shows_signature():
     """Test that passing too many args shows the expected signature."""
     tools = [
@@ -3,6 +3,7 @@
 import json
 import socket
 import threading
+import time
 
 import pytest
 from celbridge.rpc_client import RpcClient, RpcError, HEADER_DELIMITER
@@ -226,3 +227,127 @@ def test_call_without_params(mock_server):
 
     assert result == "ok"
     assert "params" not in received_requests[0]
+
+
+def test_call_handles_header_split_across_packets(mock_server):
+    """Test that a response whose header delimiter arrives in pieces is still parsed."""
+    server_socket, port = mock_server
+
+    def server_handler():
+        connection, _ = server_socket.accept()
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        request = json.loads(_read_framed_message(connection))
+
+        body = json.dumps({"jsonrpc": "2.0", "result": "split", "id": request["id"]}).encode('utf-8')
+        frame = f"Content-Length: {len(body)}".encode('utf-8') + HEADER_DELIMITER + body
+        split_index = frame.index(HEADER_DELIMITER) + 2
+        for piece in (frame[:5], frame[5:split_index], frame[split_index:]):
+            connection.sendall(piece)
+            time.sleep(0.01)
+        connection.close()
+
+    thread = threading.Thread(target=server_handler, daemon=True)
+    thread.start()
+
+    client = RpcClient('127.0.0.1', port)
+    result = client.call("Ping")
+
+    thread.join(timeout=5)
+
+    assert result == "split"
+
+
+def test_call_decodes_non_ascii_result(mock_server):
+    """Test that multi-byte UTF-8 response bodies are framed and decoded correctly."""
+    server_socket, port = mock_server
+
+    def server_handler():
+        connection, _ = server_socket.accept()
+        request = json.loads(_read_framed_message(connection))
+        response = json.dumps({"jsonrpc": "2.0", "result": "café ✓", "id": request["id"]}, ensure_ascii=False)
+        _send_framed_message(connection, response)
+        connection.close()
+
+    thread = threading.Thread(target=server_handler, daemon=True)
+    thread.start()
+
+    client = RpcClient('127.0.0.1', port)
+    result = client.call("Ping")
+
+    thread.join(timeout=5)
+
+    assert result == "café ✓"
+
+
+def test_call_keeps_data_read_past_the_current_message(mock_server):
+    """Test that a second response arriving in the same packet is kept for the next call."""
+    server_socket, port = mock_server
+
+    def server_handler():
+        connection, _ = server_socket.accept()
+        first = json.loads(_read_framed_message(connection))
+        frames = b""
+        for offset, result in enumerate(("first", "second")):
+            body = json.dumps({"jsonrpc": "2.0", "result": result, "id": first["id"] + offset}).encode('utf-8')
+            frames += f"Content-Length: {len(body)}".encode('utf-8') + HEADER_DELIMITER + body
+        connection.sendall(frames)
+        _read_framed_message(connection)
+        connection.close()
+
+    thread = threading.Thread(target=server_handler, daemon=True)
+    thread.start()
+
+    client = RpcClient('127.0.0.1', port)
+    first_result = client.call("Ping")
+    second_result = client.call("Ping")
+
+    thread.join(timeout=5)
+
+    assert first_result == "first"
+    assert second_result == "second"
+
+
+def test_call_finds_content_length_after_other_headers(mock_server):
+    """Test that Content-Length is found when other headers precede it."""
+    server_socket, port = mock_server
+
+    def server_handler():
+        connection, _ = server_socket.accept()
+        request = json.loads(_read_framed_message(connection))
+        body = json.dumps({"jsonrpc": "2.0", "result": "ok", "id": request["id"]}).encode('utf-8')
+        header = (
+            "Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}"
+        ).encode('utf-8')
+        connection.sendall(header + HEADER_DELIMITER + body)
+        connection.close()
+
+    thread = threading.Thread(target=server_handler, daemon=True)
+    thread.start()
+
+    client = RpcClient('127.0.0.1', port)
+    result = client.call("Ping")
+
+    thread.join(timeout=5)
+
+    assert result == "ok"
+
+
+def test_call_raises_without_content_length(mock_server):
+    """Test that a response header block without Content-Length raises RpcError."""
+    server_socket, port = mock_server
+
+    def server_handler():
+        connection, _ = server_socket.accept()
+        _read_framed_message(connection)
+        connection.sendall(b"Content-Type: application/json" + HEADER_DELIMITER + b"{}")
+        connection.close()
+
+    thread = threading.Thread(target=server_handler, daemon=True)
+    thread.start()
+
+    client = RpcClient('127.0.0.1', port)
+    with pytest.raises(RpcError, match="No Content-Length"):
+        client.call("Ping")
+
+    thread.join(timeout=5)